@@ -4,7 +4,9 @@ import pytest
 def dispatcher_cleanup():
     import pydispatch
     pydispatch._GLOBAL_DISPATCHER._Dispatcher__events.clear()
+    pydispatch._GLOBAL_DISPATCHER._Dispatcher__all_events.clear()
     pydispatch.decorators._CACHED_CALLBACKS.cache.clear()
     yield
     pydispatch._GLOBAL_DISPATCHER._Dispatcher__events.clear()
+    pydispatch._GLOBAL_DISPATCHER._Dispatcher__all_events.clear()
     pydispatch.decorators._CACHED_CALLBACKS.cache.clear()
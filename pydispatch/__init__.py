@@ -1,19 +1,24 @@
 import sys
-import warnings
-try:
-    import importlib.metadata as importlib_metadata
-except ImportError:
-    import importlib_metadata
-
-try:
-    __version__ = importlib_metadata.version('python-dispatch')
-except: # pragma: no cover
-    __version__ = 'unknown'
-
-if sys.version_info < (3, 6): # pragma: no cover
-    warnings.warn('You are using `python-dispatch` with a deprecated Python version. '
-                  'After version 0.1.x, `python-dispatch` will only support Python 3.6 or greater.',
-                  UserWarning)
+
+def _get_version():
+    try:
+        import importlib.metadata as importlib_metadata
+    except ImportError:
+        import importlib_metadata
+    try:
+        return importlib_metadata.version('python-dispatch')
+    except: # pragma: no cover
+        return 'unknown'
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        # Defer the metadata lookup until ``__version__`` is first accessed
+        if name == '__version__':
+            version = globals()['__version__'] = _get_version()
+            return version
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+else: # pragma: no cover
+    __version__ = _get_version()
 
 from pydispatch.dispatch import *
 from pydispatch.dispatch import _GLOBAL_DISPATCHER
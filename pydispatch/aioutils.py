@@ -1,16 +1,25 @@
 import asyncio
 import threading
-from _weakref import ref
+from types import MethodType
+from collections import deque
 from _weakrefset import _IterationGuard
 
 from pydispatch.utils import (
     WeakMethodContainer,
     isfunction,
     get_method_vars,
-    _remove_dead_weakref,
+    _get_running_loop,
 )
 
 
+def _wake_waiter(fut):
+    if not fut.done():
+        fut.set_result(None)
+
+def _create_tasks(loop, coros):
+    for coro in coros:
+        loop.create_task(coro)
+
 class AioSimpleLock(object):
     """:class:`asyncio.Lock` alternative backed by a :class:`threading.Lock`
 
@@ -22,9 +31,10 @@ class AioSimpleLock(object):
 
     .. versionadded:: 0.1.0
     """
-    __slots__ = ('lock')
+    __slots__ = ('lock', '_waiters')
     def __init__(self):
         self.lock = threading.Lock()
+        self._waiters = deque()
     def acquire(self, blocking=True, timeout=-1):
         """Acquire the :attr:`lock`
 
@@ -40,8 +50,31 @@ class AioSimpleLock(object):
         return result
     def release(self):
         """Release the :attr:`lock`
+
+        The first task waiting in :meth:`acquire_async` (if any) is woken on
+        its event loop so it may attempt to acquire it.
         """
         self.lock.release()
+        self._wake_next()
+    def _wake_next(self):
+        waiters = self._waiters
+        while waiters:
+            try:
+                loop, fut = waiters.popleft()
+            except IndexError:
+                return
+            if fut.done():
+                # Cancelled or already acquired through another path
+                continue
+            loop.call_soon_threadsafe(self._notify_waiter, fut)
+            return
+    def _notify_waiter(self, fut):
+        if fut.done():
+            # The waiter was cancelled before it could be woken, so pass
+            # the wakeup along to the next one
+            self._wake_next()
+        else:
+            fut.set_result(None)
     def __enter__(self):
         self.acquire()
         return self
@@ -50,11 +83,30 @@ class AioSimpleLock(object):
     async def acquire_async(self):
         """Acquire the :attr:`lock` asynchronously
 
+        If the lock is held, this waits on a :class:`~asyncio.Future` that is
+        resolved by :meth:`release` instead of polling.
         """
-        r = self.acquire(blocking=False)
-        while not r:
-            await asyncio.sleep(.01)
-            r = self.acquire(blocking=False)
+        lock = self.lock
+        if lock.acquire(False):
+            return
+        loop = _get_running_loop()
+        while True:
+            fut = loop.create_future()
+            self._waiters.append((loop, fut))
+            # Check again after registering in case the lock was released
+            # before the waiter was visible to :meth:`release`
+            if lock.acquire(False):
+                fut.cancel()
+                return
+            try:
+                await fut
+            except asyncio.CancelledError:
+                if not fut.cancelled():
+                    # Woken, but cancelled before resuming
+                    self._wake_next()
+                raise
+            if lock.acquire(False):
+                return
     async def __aenter__(self):
         await self.acquire_async()
         return self
@@ -70,18 +122,21 @@ class AioEventWaiter(object):
 
     Attributes:
         loop: The :class:`EventLoop <asyncio.BaseEventLoop>` instance
-        aio_event: An :class:`asyncio.Event` used to track event emission
+        aio_future: An :class:`asyncio.Future` used to track event emission.
+            This is only created if :meth:`wait` is called before the event
+            has been triggered, otherwise it will be :obj:`None`
         args (list): The positional arguments attached to the event
         kwargs (dict): The keyword arguments attached to the event
 
     .. versionadded:: 0.1.0
     """
-    __slots__ = ('loop', 'aio_event', 'args', 'kwargs')
+    __slots__ = ('loop', 'aio_future', 'args', 'kwargs', '_fired')
     def __init__(self, loop):
         self.loop = loop
-        self.aio_event = asyncio.Event()
+        self.aio_future = None
         self.args = []
         self.kwargs = {}
+        self._fired = False
     def trigger(self, *args, **kwargs):
         """Called on event emission and notifies the :meth:`wait` method
 
@@ -89,11 +144,20 @@ class AioEventWaiter(object):
         :class:`~pydispatch.dispatch.Event` instance is dispatched.
 
         Positional and keyword arguments are stored as instance attributes for
-        use in the :meth:`wait` method and :attr:`aio_event` is set.
+        use in the :meth:`wait` method and the result of :attr:`aio_future`
+        is set (if it exists). If called from outside of :attr:`loop`, this
+        is done using :meth:`~asyncio.loop.call_soon_threadsafe`.
         """
         self.args = args
         self.kwargs = kwargs
-        self.aio_event.set()
+        self._fired = True
+        fut = self.aio_future
+        if fut is not None:
+            loop = self.loop
+            if loop is _get_running_loop():
+                _wake_waiter(fut)
+            else:
+                loop.call_soon_threadsafe(_wake_waiter, fut)
     async def wait(self):
         """Waits for event emission and returns the event parameters
 
@@ -102,7 +166,12 @@ class AioEventWaiter(object):
             kwargs (dict): Keyword arguments attached to the event
 
         """
-        await self.aio_event.wait()
+        if not self._fired:
+            fut = self.aio_future = self.loop.create_future()
+            # Check again in case :meth:`trigger` was called before
+            # :attr:`aio_future` was visible to it
+            if not self._fired:
+                await fut
         return self.args, self.kwargs
     def __await__(self):
         task = asyncio.ensure_future(self.wait())
@@ -115,31 +184,32 @@ class AioEventWaiters(object):
     :keyword:`awaited <await>`
 
     Attributes:
-        waiters (set): Instances of :class:`AioEventWaiter` currently "awaiting"
-            the event
-        lock (AioSimpleLock): A sync/async lock to guard modification to the
-            :attr:`waiters` container during event emission
+        waiters (collections.deque): Instances of :class:`AioEventWaiter`
+            currently "awaiting" the event
+
+    Note:
+        The :attr:`waiters` container is only modified using operations that
+        are atomic (:meth:`~collections.deque.append` and
+        :meth:`~collections.deque.popleft`), so no lock is required when
+        events are emitted from other threads.
 
     .. versionadded:: 0.1.0
     """
-    __slots__ = ('waiters', 'lock')
+    __slots__ = ('waiters',)
     def __init__(self):
-        self.waiters = set()
-        self.lock = AioSimpleLock()
+        self.waiters = deque()
     async def add_waiter(self):
         """Add a :class:`AioEventWaiter` to the :attr:`waiters` container
 
-        The event loop to use for :attr:`AioEventWaiter.loop` is found in the
-        current context using :func:`asyncio.get_event_loop`
+        The event loop to use for :attr:`AioEventWaiter.loop` is the loop
+        running in the current context
 
         Returns:
             waiter: The created :class:`AioEventWaiter` instance
 
         """
-        loop = asyncio.get_event_loop()
-        async with self.lock:
-            waiter = AioEventWaiter(loop)
-            self.waiters.add(waiter)
+        waiter = AioEventWaiter(_get_running_loop())
+        self.waiters.append(waiter)
         return waiter
     async def wait(self):
         """Creates a :class:`waiter <AioEventWaiter>` and "awaits" its result
@@ -168,10 +238,13 @@ class AioEventWaiters(object):
             *args: Positional arguments to pass to :meth:`AioEventWaiter.trigger`
             **kwargs: Keyword arguments to pass to :meth:`AioEventWaiter.trigger`
         """
-        with self.lock:
-            for waiter in self.waiters:
-                waiter.trigger(*args, **kwargs)
-            self.waiters.clear()
+        pop = self.waiters.popleft
+        while True:
+            try:
+                waiter = pop()
+            except IndexError:
+                break
+            waiter.trigger(*args, **kwargs)
 
 
 class AioWeakMethodContainer(WeakMethodContainer):
@@ -181,17 +254,6 @@ class AioWeakMethodContainer(WeakMethodContainer):
     """
     def __init__(self):
         super().__init__()
-        def remove(wr, selfref=ref(self)):
-            self = selfref()
-            if self is not None:
-                if self._iterating:
-                    self._pending_removals.append(wr.key)
-                else:
-                    # Atomic removal is necessary since this function
-                    # can be called asynchronously by the GC
-                    _remove_dead_weakref(self.data, wr.key)
-                    self._on_weakref_fin(wr.key)
-        self._remove = remove
         self.event_loop_map = {}
     def add_method(self, loop, callback):
         """Add a coroutine function
@@ -203,12 +265,14 @@ class AioWeakMethodContainer(WeakMethodContainer):
         """
         if isfunction(callback):
             wrkey = ('function', id(callback))
-            self[wrkey] = callback
+            obj = callback
         else:
             f, obj = get_method_vars(callback)
             wrkey = (f, id(obj))
-            self[wrkey] = obj
+        # Store the loop first so it is available as soon as the callback
+        # is visible to :meth:`_build_emit_plan`
         self.event_loop_map[wrkey] = loop
+        self[wrkey] = obj
     def iter_instances(self):
         """Iterate over the stored objects
 
@@ -224,48 +288,119 @@ class AioWeakMethodContainer(WeakMethodContainer):
 
         .. seealso:: :meth:`pydispatch.utils.WeakMethodContainer.iter_instances`
         """
-        for wrkey, obj in self.iter_instances():
-            f, obj_id = wrkey
+        yield from self._snapshot()
+    def _snapshot(self):
+        """Build a list of ``(loop, method)`` tuples for all live callbacks
+
+        The stored weak references are resolved in a single pass while
+        guarded against removal by the garbage collector.
+        """
+        event_loop_map = self.event_loop_map
+        result = []
+        with _IterationGuard(self):
+            for wrkey, wr in self.data.items():
+                obj = wr()
+                if obj is None:
+                    continue
+                f = wrkey[0]
+                if f == 'function':
+                    m = obj
+                else:
+                    m = MethodType(f, obj)
+                result.append((event_loop_map[wrkey], m))
+        return result
+    def _build_emit_plan(self):
+        """Build a tuple of ``(loop, weakref, function)`` for all callbacks
+
+        The function is :obj:`None` for stored functions (where the weakref
+        refers to the function itself) and the unbound function for methods.
+
+        .. seealso:: :meth:`pydispatch.utils.WeakMethodContainer._get_emit_plan`
+        """
+        event_loop_map = self.event_loop_map
+        plan = []
+        for wrkey, wr in list(self.data.items()):
+            loop = event_loop_map.get(wrkey)
+            if loop is None:
+                continue
+            f = wrkey[0]
             if f == 'function':
-                m = self[wrkey]
-            else:
-                m = getattr(obj, f.__name__)
-            loop = self.event_loop_map[wrkey]
-            yield loop, m
+                f = None
+            plan.append((loop, wr, f))
+        return tuple(plan)
     def _on_weakref_fin(self, key):
-        if key in self.event_loop_map:
-            del self.event_loop_map[key]
+        self.event_loop_map.pop(key, None)
+        super()._on_weakref_fin(key)
     def submit_coroutine(self, coro, loop):
         """Schedule and await a coroutine on the specified loop
 
-        The coroutine is wrapped and scheduled using
+        The coroutine is scheduled using
         :func:`asyncio.run_coroutine_threadsafe`. While the coroutine is
         "awaited", the result is not available as method returns immediately.
 
+        If *loop* is the event loop running in the current thread, the
+        coroutine is scheduled directly with :meth:`~asyncio.loop.create_task`
+        since no thread-safe handoff is needed. In either case it will not
+        begin execution before this method returns.
+
         Args:
             coro: The :term:`coroutine` to schedule
             loop: The :class:`event loop <asyncio.BaseEventLoop>` on which to
                 schedule the coroutine
 
         Note:
-            This method is used internally by :meth:`__call__` and is not meant
-            to be called directly.
+            This method performs the same scheduling as :meth:`__call__` for a
+            single coroutine and is not meant to be called directly.
         """
-        async def _do_call(_coro):
-            with _IterationGuard(self):
-                await _coro
-        asyncio.run_coroutine_threadsafe(_do_call(coro), loop=loop)
+        if loop is _get_running_loop():
+            loop.create_task(coro)
+        else:
+            asyncio.run_coroutine_threadsafe(coro, loop=loop)
     def __call__(self, *args, **kwargs):
         """Triggers all stored callbacks (coroutines)
 
+        Coroutines for the running loop are scheduled directly. Those for
+        any other loop are handed to it in a single
+        :meth:`~asyncio.loop.call_soon_threadsafe` call per loop.
+
         Args:
             *args: Positional arguments to pass to callbacks
             **kwargs: Keyword arguments to pass to callbacks
         """
-        for loop, m in self.iter_methods():
+        running_loop = _get_running_loop()
+        # Coroutines for other loops, grouped so each loop is only
+        # woken once per emission
+        pending = None
+        for loop, wr, f in self._get_emit_plan():
+            obj = wr()
+            if obj is None:
+                continue
+            if f is None:
+                m = obj
+            else:
+                m = MethodType(f, obj)
             coro = m(*args, **kwargs)
-            self.submit_coroutine(coro, loop)
+            if loop is running_loop:
+                loop.create_task(coro)
+            elif pending is None:
+                pending = {loop:[coro]}
+            elif loop in pending:
+                pending[loop].append(coro)
+            else:
+                pending[loop] = [coro]
+        if pending is not None:
+            for loop, coros in pending.items():
+                loop.call_soon_threadsafe(_create_tasks, loop, coros)
     def __delitem__(self, key):
-        if key in self.event_loop_map:
-            del self.event_loop_map[key]
+        self.event_loop_map.pop(key, None)
         return super().__delitem__(key)
+    def pop(self, key, *args):
+        self.event_loop_map.pop(key, None)
+        return super().pop(key, *args)
+    def popitem(self):
+        key, value = super().popitem()
+        self.event_loop_map.pop(key, None)
+        return key, value
+    def clear(self):
+        self.event_loop_map.clear()
+        super().clear()
@@ -1,4 +1,4 @@
-from typing import Union, Iterable, Iterator, Callable
+from typing import Union, Iterable, List, Callable
 import asyncio
 
 import pydispatch
@@ -8,6 +8,7 @@ from .utils import iscoroutinefunction, WeakMethodContainer
 __all__ = ('receiver',)
 
 class CallbackCache:
+    __slots__ = ('cache',)
     def __init__(self):
         self.cache = {}
 
@@ -18,12 +19,11 @@ class CallbackCache:
             self.cache[name] = wr_contain
         wr_contain.add_method(func)
 
-    def get(self, name: str) -> Iterator[Callable]:
-        wr_contain = self.cache.get(name)
-        if wr_contain is not None:
-            del self.cache[name]
-            yield from wr_contain.iter_methods()
-        yield from []
+    def get(self, name: str) -> List[Callable]:
+        wr_contain = self.cache.pop(name, None)
+        if wr_contain is None:
+            return []
+        return list(wr_contain.iter_methods())
 
     def __contains__(self, name: str) -> bool:
         return name in self.cache
@@ -96,14 +96,14 @@ def receiver(
 
     .. versionadded:: 0.2.2
     """
+    if isinstance(event_name, str):
+        event_names = (event_name,)
+    else:
+        event_names = tuple(event_name)
+
     def _decorator(func: Callable):
         is_async = iscoroutinefunction(func)
-
-        if isinstance(event_name, str):
-            event_names = [event_name]
-        else:
-            event_names = event_name
-        bind_kwargs = {ev:func for ev in event_names}
+        bind_kwargs = dict.fromkeys(event_names, func)
         if auto_register or cache:
             for name in event_names:
                 if not _GLOBAL_DISPATCHER._has_event(name):
@@ -126,10 +126,11 @@ def _post_register_hook(*names):
     for name in names:
         if name not in _CACHED_CALLBACKS:
             continue
-        bind_kwargs = {name:cb for cb in _CACHED_CALLBACKS.get(name)}
-        is_async = any((iscoroutinefunction(cb) for cb in bind_kwargs.values()))
-        if is_async:
-            loop = asyncio.get_event_loop()
-            pydispatch.bind_async(loop, **bind_kwargs)
-        else:
-            pydispatch.bind(**bind_kwargs)
+        # Each callback is bound separately since they share the same
+        # event name (which would collide as keyword arguments)
+        for cb in _CACHED_CALLBACKS.get(name):
+            if iscoroutinefunction(cb):
+                loop = asyncio.get_event_loop()
+                pydispatch.bind_async(loop, **{name:cb})
+            else:
+                pydispatch.bind(**{name:cb})
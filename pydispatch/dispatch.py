@@ -1,4 +1,5 @@
 import types
+import weakref
 
 from pydispatch.utils import (
     WeakMethodContainer,
@@ -56,18 +57,63 @@ class PropertyExistsError(ExistsError):
     """
 
 
+def _remove_property_instances(obj_id, props):
+    for prop in props:
+        prop._on_weakref_fin(obj_id)
+
+
 class Event(object):
     """Holds references to event names and subscribed listeners
 
     This is used internally by :class:`Dispatcher`.
     """
-    __slots__ = ('name', 'listeners', 'aio_waiters', 'aio_listeners', 'emission_lock')
+    __slots__ = (
+        'name', 'listeners', '_aio_waiters', '_aio_listeners', '_emission_lock',
+        '_emission_held', '_has_aio',
+    )
     def __init__(self, name):
         self.name = name
         self.listeners = WeakMethodContainer()
-        self.aio_listeners = AioWeakMethodContainer()
-        self.aio_waiters = AioEventWaiters()
-        self.emission_lock = EmissionHoldLock(self)
+        self._aio_listeners = None
+        self._aio_waiters = None
+        self._emission_lock = None
+        self._emission_held = False
+        # Set once either of the asyncio containers is created
+        self._has_aio = False
+    @property
+    def aio_listeners(self):
+        """The :class:`~pydispatch.aioutils.AioWeakMethodContainer` holding
+        coroutine function listeners
+
+        This is created on first access
+        """
+        obj = self._aio_listeners
+        if obj is None:
+            obj = self._aio_listeners = AioWeakMethodContainer()
+            self._has_aio = True
+        return obj
+    @property
+    def aio_waiters(self):
+        """The :class:`~pydispatch.aioutils.AioEventWaiters` used when the
+        event is :keyword:`awaited <await>`
+
+        This is created on first access
+        """
+        obj = self._aio_waiters
+        if obj is None:
+            obj = self._aio_waiters = AioEventWaiters()
+            self._has_aio = True
+        return obj
+    @property
+    def emission_lock(self):
+        """The :class:`~pydispatch.utils.EmissionHoldLock` for the event
+
+        This is created on first access
+        """
+        lock = self._emission_lock
+        if lock is None:
+            lock = self._emission_lock = EmissionHoldLock(self)
+        return lock
     def add_listener(self, callback, **kwargs):
         if iscoroutinefunction(callback):
             loop = kwargs.get('__aio_loop__')
@@ -77,24 +123,63 @@ class Event(object):
         else:
             self.listeners.add_method(callback)
     def remove_listener(self, obj):
-        if isinstance(obj, (types.MethodType, types.FunctionType)):
-            self.listeners.del_method(obj)
-            self.aio_listeners.del_method(obj)
-        else:
-            self.listeners.del_instance(obj)
-            self.aio_listeners.del_instance(obj)
+        is_method = isinstance(obj, (types.MethodType, types.FunctionType))
+        for container in (self.listeners, self._aio_listeners):
+            # Nothing to search in containers that are empty or not created
+            if container is None or not container.data:
+                continue
+            if is_method:
+                container.del_method(obj)
+            else:
+                container.del_instance(obj)
+    def _has_observers(self):
+        if self.listeners.data or self._emission_held:
+            return True
+        if not self._has_aio:
+            return False
+        # The asyncio containers are kept once created, so check whether
+        # anything is still bound to or awaiting the event
+        aio_listeners = self._aio_listeners
+        if aio_listeners is not None and aio_listeners.data:
+            return True
+        aio_waiters = self._aio_waiters
+        return aio_waiters is not None and bool(aio_waiters.waiters)
     def __call__(self, *args, **kwargs):
         """Dispatches the event to listeners
 
         Called by :meth:`~Dispatcher.emit`
         """
-        if self.emission_lock.held:
-            self.emission_lock.last_event = (args, kwargs)
+        if self._emission_held:
+            self._emission_lock.last_event = (args, kwargs)
             return
-        self.aio_waiters(*args, **kwargs)
-        self.aio_listeners(*args, **kwargs)
-        for m in self.listeners.iter_methods():
-            r = m(*args, **kwargs)
+        if self._has_aio:
+            aio_waiters = self._aio_waiters
+            if aio_waiters is not None:
+                aio_waiters(*args, **kwargs)
+            aio_listeners = self._aio_listeners
+            if aio_listeners is not None:
+                aio_listeners(*args, **kwargs)
+        listeners = self.listeners
+        if not listeners.data:
+            return
+        plan = listeners._get_emit_plan()
+        MethodType = types.MethodType
+        for wrkey, wr, f in plan:
+            obj = wr()
+            if obj is None:
+                continue
+            if listeners._emit_plan is not plan and wrkey not in listeners.data:
+                # Removed by a previous callback during this emission
+                continue
+            if f is None:
+                m = obj
+            else:
+                m = MethodType(f, obj)
+            if kwargs:
+                r = m(*args, **kwargs)
+            else:
+                # Avoids passing an empty dict for each listener
+                r = m(*args)
             if r is False:
                 return r
     def __await__(self):
@@ -118,10 +203,12 @@ class Dispatcher(object):
 
     Once defined, an event can be dispatched to listeners by calling :meth:`emit`.
     """
+    _PROPERTIES_ = {}
+    _EVENTS_ = set()
     def __init_subclass__(cls, *args, **kwargs):
         super().__init_subclass__()
-        props = getattr(cls, '_PROPERTIES_', {}).copy()
-        events = getattr(cls, '_EVENTS_', set()).copy()
+        props = cls._PROPERTIES_.copy()
+        events = cls._EVENTS_.copy()
         for key, val in cls.__dict__.items():
             if key == '_events_':
                 events |= set(val)
@@ -139,15 +226,24 @@ class Dispatcher(object):
         # This is only here to prevent exceptions being raised
         pass
     def __init_events(self):
-        if hasattr(self, '_Dispatcher__events'):
-            return
-        self.__events = {}
-        for name in self._EVENTS_:
-            self.__events[name] = Event(name)
+        # Event objects are created on first use (see __get_event). Until
+        # then the names are held with a value of None
+        self.__events = dict.fromkeys(self._EVENTS_)
         self.__property_events = {}
-        for name, prop in self._PROPERTIES_.items():
-            self.__property_events[name] = Event(name)
+        props = self._PROPERTIES_
+        for name, prop in props.items():
+            self.__property_events[name] = None
             prop._add_instance(self)
+        if props:
+            # A single finalizer removes the stored values from all
+            # properties once this instance is garbage collected
+            fin = weakref.finalize(
+                self, _remove_property_instances, id(self), tuple(props.values()),
+            )
+            fin.atexit = False
+        # Single lookup table for emit/bind. Properties take precedence
+        # over events of the same name
+        self.__all_events = {**self.__events, **self.__property_events}
     def register_event(self, *names):
         """Registers new events after instance creation
 
@@ -167,7 +263,22 @@ class Dispatcher(object):
                 raise EventExistsError(name)
             elif name in self.__property_events:
                 raise PropertyExistsError(name)
-            self.__events[name] = Event(name)
+            e = Event(name)
+            self.__events[name] = e
+            self.__all_events[name] = e
+    def __get_event(self, name):
+        try:
+            e = self.__all_events[name]
+        except KeyError:
+            raise DoesNotExistError(name)
+        if e is None:
+            e = Event(name)
+            if name in self.__property_events:
+                self.__property_events[name] = e
+            else:
+                self.__events[name] = e
+            self.__all_events[name] = e
+        return e
     def bind(self, **kwargs):
         """Subscribes to events or to :class:`~pydispatch.properties.Property` updates
 
@@ -233,16 +344,8 @@ class Dispatcher(object):
 
         """
         aio_loop = kwargs.pop('__aio_loop__', None)
-        props = self.__property_events
-        events = self.__events
         for name, cb in kwargs.items():
-            if name in props:
-                e = props[name]
-            else:
-                try:
-                    e = events[name]
-                except KeyError:
-                    raise DoesNotExistError(name)
+            e = self.__get_event(name)
             e.add_listener(cb, __aio_loop__=aio_loop)
     def unbind(self, *args):
         """Unsubscribes from events or :class:`~pydispatch.properties.Property` updates
@@ -258,9 +361,11 @@ class Dispatcher(object):
         events = self.__events.values()
         for arg in args:
             for prop in props:
-                prop.remove_listener(arg)
+                if prop is not None:
+                    prop.remove_listener(arg)
             for e in events:
-                e.remove_listener(arg)
+                if e is not None:
+                    e.remove_listener(arg)
     def bind_async(self, loop, **kwargs):
         """Subscribes to events with async callbacks
 
@@ -301,12 +406,12 @@ class Dispatcher(object):
             :class:`DoesNotExistError` is now raised if the event or property
             does not exist
         """
-        e = self.__property_events.get(name)
+        e = self.__all_events.get(name)
         if e is None:
-            try:
-                e = self.__events[name]
-            except KeyError:
+            if name not in self.__all_events:
                 raise DoesNotExistError(name)
+            # Nothing has used the event yet, so there is nothing to notify
+            return
         return e(*args, **kwargs)
     def get_dispatcher_event(self, name):
         """Retrieves an Event object by name
@@ -327,13 +432,12 @@ class Dispatcher(object):
 
         .. versionadded:: 0.1.0
         """
-        e = self.__property_events.get(name)
-        if e is None:
-            try:
-                e = self.__events[name]
-            except KeyError:
-                raise DoesNotExistError(name)
-        return e
+        return self.__get_event(name)
+    def _has_observers(self, name):
+        # True if emitting the event could reach a listener, an awaiting
+        # task or a held emission lock
+        e = self.__all_events.get(name)
+        return e is not None and e._has_observers()
     def emission_lock(self, name):
         """Holds emission of events and dispatches the last event on release
 
@@ -383,11 +487,7 @@ class Dispatcher(object):
 
 class _GlobalDispatcher(Dispatcher):
     def _has_event(self, name):
-        try:
-            self.get_dispatcher_event(name)
-        except KeyError:
-            return False
-        return True
+        return name in self._Dispatcher__all_events
 
 
 _GLOBAL_DISPATCHER = _GlobalDispatcher()
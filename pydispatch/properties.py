@@ -36,9 +36,6 @@ equality checking. In most cases, this will be handled automatically.
 
 import weakref
 
-from pydispatch.utils import InformativeWVDict
-
-
 __all__ = ['Property', 'ListProperty', 'DictProperty']
 
 class Property(object):
@@ -54,11 +51,11 @@ class Property(object):
             :class:`~pydispatch.dispatch.Dispatcher` instance.
 
     """
+    __slots__ = ('_name', 'default', '__storage')
     def __init__(self, default=None):
         self._name = ''
         self.default = default
         self.__storage = {}
-        self.__weakrefs = InformativeWVDict(del_callback=self._on_weakref_fin)
     @property
     def name(self):
         return self._name
@@ -67,29 +64,47 @@ class Property(object):
     def _add_instance(self, obj, default=None):
         if default is None:
             default = self.default
-        self.__storage[id(obj)] = self.default
-        self.__weakrefs[id(obj)] = obj
+        self.__storage[id(obj)] = default
+    def _add_tracked_instance(self, obj):
+        # For instances not covered by the Dispatcher's finalizer (a
+        # Property attached after class creation or defined on a mixin)
+        self._add_instance(obj)
+        fin = weakref.finalize(obj, self._on_weakref_fin, id(obj))
+        fin.atexit = False
     def _del_instance(self, obj):
         del self.__storage[id(obj)]
     def _on_weakref_fin(self, obj_id):
-        if obj_id in self.__storage:
-            del self.__storage[obj_id]
+        # Called by a finalizer registered by the Dispatcher instance
+        self.__storage.pop(obj_id, None)
     def __get__(self, obj, objcls=None):
         if obj is None:
             return self
         obj_id = id(obj)
-        if obj_id not in self.__storage:
-            self._add_instance(obj)
+        try:
+            return self.__storage[obj_id]
+        except KeyError:
+            self._add_tracked_instance(obj)
         return self.__storage[obj_id]
     def __set__(self, obj, value):
+        storage = self.__storage
         obj_id = id(obj)
-        if obj_id not in self.__storage:
-            self._add_instance(obj)
-        current = self.__storage[obj_id]
-        if current == value:
+        try:
+            current = storage[obj_id]
+        except KeyError:
+            self._add_tracked_instance(obj)
+            current = storage[obj_id]
+        if current is value or current == value:
             return
-        self.__storage[obj_id] = value
-        self._on_change(obj, current, value)
+        value = self._build_value(obj, value)
+        storage[obj_id] = value
+        # Same as _on_change() without the extra call
+        obj.emit(self._name, obj, value, old=current, property=self)
+    def _build_value(self, obj, value):
+        """Convert a newly assigned value before it is stored
+
+        This is only called when the value differs from the current one
+        """
+        return value
     def _on_change(self, obj, old, value, **kwargs):
         """Called internally to emit changes from the instance object
 
@@ -107,8 +122,12 @@ class Property(object):
                 container.
 
         """
-        kwargs['property'] = self
-        obj.emit(self.name, obj, value, old=old, **kwargs)
+        # Use the attribute directly rather than the `name` property
+        if kwargs:
+            obj.emit(self._name, obj, value, old=old, property=self, **kwargs)
+        else:
+            # Plain value changes have no extra arguments to merge
+            obj.emit(self._name, obj, value, old=old, property=self)
     def __repr__(self):
         return '<{}: {}>'.format(self.__class__, self)
     def __str__(self):
@@ -129,6 +148,7 @@ class ListProperty(Property):
     Changes to the contents of the list are able to be observed through
     :class:`ObservableList`.
     """
+    __slots__ = ('copy_on_change',)
     def __init__(self, default=None, copy_on_change=False):
         if default is None:
             default = []
@@ -139,16 +159,15 @@ class ListProperty(Property):
         default = ObservableList(default, obj=obj, property=self)
         super(ListProperty, self)._add_instance(obj, default)
     def __set__(self, obj, value):
-        value = ObservableList(value, obj=obj, property=self)
+        # Normalize so the comparison with the current value matches the
+        # list that would be stored
+        if value is None:
+            value = []
+        elif not isinstance(value, list):
+            value = list(value)
         super(ListProperty, self).__set__(obj, value)
-    def __get__(self, obj, objcls=None):
-        if obj is None:
-            return self
-        value = super(ListProperty, self).__get__(obj, objcls)
-        if not isinstance(value, ObservableList):
-            value = ObservableList(value, obj=obj, property=self)
-            self._Property__storage[id(obj)] = value
-        return value
+    def _build_value(self, obj, value):
+        return ObservableList(value, obj=obj, property=self)
 
 class DictProperty(Property):
     """Property with a :class:`dict` type value
@@ -165,6 +184,7 @@ class DictProperty(Property):
     Changes to the contents of the dict are able to be observed through
     :class:`ObservableDict`.
     """
+    __slots__ = ('copy_on_change',)
     def __init__(self, default=None, copy_on_change=False):
         if default is None:
             default = {}
@@ -175,16 +195,15 @@ class DictProperty(Property):
         default = ObservableDict(default, obj=obj, property=self)
         super(DictProperty, self)._add_instance(obj, default)
     def __set__(self, obj, value):
-        value = ObservableDict(value, obj=obj, property=self)
+        # Normalize so the comparison with the current value matches the
+        # dict that would be stored
+        if value is None:
+            value = {}
+        elif not isinstance(value, dict):
+            value = dict(value)
         super(DictProperty, self).__set__(obj, value)
-    def __get__(self, obj, objcls=None):
-        if obj is None:
-            return self
-        value = super(DictProperty, self).__get__(obj, objcls)
-        if not isinstance(value, ObservableDict):
-            value = ObservableDict(value, obj=obj, property=self)
-            self._Property__storage[id(obj)] = value
-        return value
+    def _build_value(self, obj, value):
+        return ObservableDict(value, obj=obj, property=self)
 
 class Observable(object):
     """Mixin used by :class:`ObservableList` and :class:`ObservableDict`
@@ -197,18 +216,56 @@ class Observable(object):
     copied and replaced by another :class:`ObservableDict`. This allows nested
     containers to be observed and their changes to be tracked.
     """
+    __slots__ = ()
+    @property
+    def obj(self):
+        """The :class:`~pydispatch.dispatch.Dispatcher` instance that owns
+        the container (or :obj:`None`)
+
+        Only a weak reference is held since the containers are kept in the
+        class-level :class:`Property` storage
+        """
+        obj_ref = self._obj_ref
+        if obj_ref is None:
+            return None
+        return obj_ref()
     def _build_observable(self, item):
-        if isinstance(item, list):
-            item = ObservableList(item, parent=self)
-        elif isinstance(item, dict):
-            item = ObservableDict(item, parent=self)
-        return item
+        cls = _OBSERVABLE_TYPES.get(type(item), _UNKNOWN_TYPE)
+        if cls is None:
+            # Common leaf types are stored as-is
+            return item
+        if cls is _UNKNOWN_TYPE:
+            if not isinstance(item, (list, dict)):
+                return item
+            if isinstance(item, list):
+                cls = ObservableList
+            else:
+                cls = ObservableDict
+        return cls(item, parent=self)
+    def _build_observable_for_key(self, key, item):
+        # Re-assigning a nested container to its own slot (``obs[0] = obs[0]``)
+        # keeps the existing wrapper. Anywhere else it is copied so two
+        # slots never share one container
+        if isinstance(item, Observable) and item.parent_observable is self:
+            try:
+                if self[key] is item:
+                    return item
+            except (IndexError, KeyError, TypeError):
+                pass
+        return self._build_observable(item)
     def _get_copy_or_none(self):
-        p = self.parent_observable
-        if p is not None:
-            return p._get_copy_or_none()
+        if not self._init_complete:
+            # Changes are not emitted during __init__
+            return None
+        root = self._root
+        if root is not self:
+            return root._get_copy_or_none()
         if not self.copy_on_change:
             return None
+        obj = self.obj
+        if obj is None or not obj._has_observers(self.property._name):
+            # Nothing could receive the copy (as the "old" argument)
+            return None
         return self._deepcopy()
     def _deepcopy(self):
         o = self.copy()
@@ -224,11 +281,17 @@ class Observable(object):
         if not self._init_complete:
             return
         old = kwargs.pop('old')
-        p = self.parent_observable
-        if p is not None:
-            p._emit_change(old=old)
+        root = self._root
+        if root is not self:
+            # Changes to nested containers are emitted from the root
+            # without their keys
+            if not root._init_complete:
+                return
+            kwargs = {}
+        obj = root.obj
+        if obj is None:
             return
-        self.property._on_change(self.obj, old, self, **kwargs)
+        root.property._on_change(obj, old, root, **kwargs)
 
 class ObservableList(list, Observable):
     """A :class:`list` subclass that tracks changes to its contents
@@ -236,12 +299,19 @@ class ObservableList(list, Observable):
     Note:
         This class is for internal use and not intended to be used directly
     """
+    __slots__ = (
+        'property', '_obj_ref', 'parent_observable', '_root', 'copy_on_change',
+        '_init_complete',
+    )
     def __init__(self, initlist=None, **kwargs):
         self._init_complete = False
         super(ObservableList, self).__init__()
         self.property = kwargs.get('property')
-        self.obj = kwargs.get('obj')
-        self.parent_observable = kwargs.get('parent')
+        obj = kwargs.get('obj')
+        self._obj_ref = None if obj is None else weakref.ref(obj)
+        self.parent_observable = p = kwargs.get('parent')
+        # The top-level container, which emits changes for the property
+        self._root = self if p is None else p._root
         if self.property is not None:
             self.copy_on_change = self.property.copy_on_change
         else:
@@ -251,7 +321,7 @@ class ObservableList(list, Observable):
         self._init_complete = True
     def __setitem__(self, key, item):
         old = self._get_copy_or_none()
-        item = self._build_observable(item)
+        item = self._build_observable_for_key(key, item)
         super(ObservableList, self).__setitem__(key, item)
         self._emit_change(keys=[key], old=old)
     def __delitem__(self, key):
@@ -273,12 +343,11 @@ class ObservableList(list, Observable):
         self._emit_change(old=old)
     def extend(self, other):
         old = self._get_copy_or_none()
-        init = self._init_complete
-        self._init_complete = False
-        for item in other:
-            self.append(item)
-        if init:
-            self._init_complete = True
+        # Items are added without going through append() so only one
+        # copy is made and one change is emitted for the whole operation
+        build_observable = self._build_observable
+        items = [build_observable(item) for item in other]
+        super(ObservableList, self).extend(items)
         self._emit_change(old=old)
     def remove(self, *args):
         old = self._get_copy_or_none()
@@ -291,12 +360,19 @@ class ObservableDict(dict, Observable):
     Note:
         This class is for internal use and not intended to be used directly
     """
+    __slots__ = (
+        'property', '_obj_ref', 'parent_observable', '_root', 'copy_on_change',
+        '_init_complete',
+    )
     def __init__(self, initdict=None, **kwargs):
         self._init_complete = False
         super(ObservableDict, self).__init__()
         self.property = kwargs.get('property')
-        self.obj = kwargs.get('obj')
-        self.parent_observable = kwargs.get('parent')
+        obj = kwargs.get('obj')
+        self._obj_ref = None if obj is None else weakref.ref(obj)
+        self.parent_observable = p = kwargs.get('parent')
+        # The top-level container, which emits changes for the property
+        self._root = self if p is None else p._root
         if self.property is not None:
             self.copy_on_change = self.property.copy_on_change
         else:
@@ -306,7 +382,7 @@ class ObservableDict(dict, Observable):
         self._init_complete = True
     def __setitem__(self, key, item):
         old = self._get_copy_or_none()
-        item = self._build_observable(item)
+        item = self._build_observable_for_key(key, item)
         super(ObservableDict, self).__setitem__(key, item)
         self._emit_change(keys=[key], old=old)
     def __delitem__(self, key):
@@ -315,26 +391,49 @@ class ObservableDict(dict, Observable):
         self._emit_change(old=old)
     def update(self, other):
         old = self._get_copy_or_none()
-        init = self._init_complete
-        self._init_complete = False
-        keys = set(other.keys()) - set(self.keys())
-        for key, val in other.items():
-            if key not in keys and self[key] == val:
-                continue
-            self[key] = val
-            keys.add(key)
-        if init:
-            self._init_complete = True
-        self._emit_change(keys=list(keys), old=old)
+        # Items are set without going through __setitem__() so only one
+        # copy is made and one change is emitted for the whole operation
+        build_observable = self._build_observable
+        changed = {
+            key: build_observable(val) for key, val in other.items()
+            if key not in self or self[key] != val
+        }
+        super(ObservableDict, self).update(changed)
+        self._emit_change(keys=list(changed), old=old)
     def clear(self):
         old = self._get_copy_or_none()
         super(ObservableDict, self).clear()
         self._emit_change(old=old)
-    def pop(self, *args):
+    def pop(self, key, *args):
+        if key not in self:
+            # Raises KeyError or returns the default without any change
+            return super(ObservableDict, self).pop(key, *args)
         old = self._get_copy_or_none()
-        super(ObservableDict, self).pop(*args)
+        value = super(ObservableDict, self).pop(key)
         self._emit_change(old=old)
-    def setdefault(self, *args):
+        return value
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
         old = self._get_copy_or_none()
-        super(ObservableDict, self).setdefault(*args)
+        value = self._build_observable(default)
+        super(ObservableDict, self).__setitem__(key, value)
         self._emit_change(old=old)
+        return value
+
+
+# Exact type lookups for Observable._build_observable. Types mapped to None
+# are stored as-is and anything not listed falls back to isinstance checks
+_UNKNOWN_TYPE = object()
+_OBSERVABLE_TYPES = {
+    list: ObservableList,
+    dict: ObservableDict,
+    type(None): None,
+    bool: None,
+    int: None,
+    float: None,
+    complex: None,
+    str: None,
+    bytes: None,
+    tuple: None,
+}
@@ -1,13 +1,22 @@
 import weakref
 from weakref import ref, _remove_dead_weakref
-from _weakref import ref
 import types
 import asyncio
 
+def _remove_dead_key(d, key):
+    """Remove *key* from *d* if its weakref is dead
+
+    Returns :obj:`True` only if the key was removed by this call. If it was
+    already removed or now refers to a live object (such as a new object
+    stored under a reused :func:`id`), nothing is changed.
+    """
+    if key not in d:
+        return False
+    _remove_dead_weakref(d, key)
+    return key not in d
+
 def get_method_vars(m):
-    f = m.__func__
-    obj = m.__self__
-    return f, obj
+    return m.__func__, m.__self__
 
 def isfunction(m):
     return isinstance(m, types.FunctionType)
@@ -15,6 +24,11 @@ def isfunction(m):
 def iscoroutinefunction(obj):
     return asyncio.iscoroutinefunction(obj)
 
+# Returns the loop running in the current thread (or None). Within coroutines
+# this is a cheaper equivalent to asyncio.get_event_loop() and unlike
+# asyncio.get_running_loop() it is available in Python 3.6
+_get_running_loop = asyncio._get_running_loop
+
 class WeakMethodContainer(weakref.WeakValueDictionary):
     """Container to store weak references to callbacks
 
@@ -25,6 +39,95 @@ class WeakMethodContainer(weakref.WeakValueDictionary):
     Functions are stored using the string "function" and the id of the function
     as the key (a two-tuple).
     """
+    def __init__(self):
+        # Equivalent to WeakValueDictionary.__init__, but with a removal
+        # callback that also notifies :meth:`_on_weakref_fin`
+        def remove(wr, selfref=ref(self)):
+            self = selfref()
+            if self is not None:
+                if self._iterating:
+                    self._pending_removals.append(wr.key)
+                else:
+                    # Atomic removal is necessary since this function
+                    # can be called asynchronously by the GC
+                    if _remove_dead_key(self.data, wr.key):
+                        self._on_weakref_fin(wr.key)
+        self._remove = remove
+        self._pending_removals = []
+        self._iterating = set()
+        self.data = {}
+        self._emit_plan = None
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._emit_plan = None
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._emit_plan = None
+    # The remaining mutating methods of WeakValueDictionary operate on
+    # :attr:`data` directly, so they need to invalidate the plan as well
+    def pop(self, key, *args):
+        try:
+            return super().pop(key, *args)
+        finally:
+            self._emit_plan = None
+    def popitem(self):
+        try:
+            return super().popitem()
+        finally:
+            self._emit_plan = None
+    def setdefault(self, key, default=None):
+        try:
+            return super().setdefault(key, default)
+        finally:
+            self._emit_plan = None
+    def update(self, *args, **kwargs):
+        try:
+            super().update(*args, **kwargs)
+        finally:
+            self._emit_plan = None
+    def clear(self):
+        super().clear()
+        self._emit_plan = None
+    def _commit_removals(self):
+        pop = self._pending_removals.pop
+        d = self.data
+        while True:
+            try:
+                key = pop()
+            except IndexError:
+                return
+            if _remove_dead_key(d, key):
+                self._on_weakref_fin(key)
+    def _on_weakref_fin(self, key):
+        """Called when a stored object has been garbage collected
+
+        Subclasses may override this to clean up any data associated with *key*
+        """
+        self._emit_plan = None
+    def _build_emit_plan(self):
+        """Build a tuple of ``(wrkey, weakref, function)`` for all callbacks
+
+        The function is :obj:`None` for stored functions (where the weakref
+        refers to the function itself) and the unbound function for methods.
+        """
+        plan = []
+        for wrkey, wr in list(self.data.items()):
+            f = wrkey[0]
+            if f == 'function':
+                f = None
+            plan.append((wrkey, wr, f))
+        return tuple(plan)
+    def _get_emit_plan(self):
+        """Get the result of :meth:`_build_emit_plan`
+
+        The result is cached until callbacks are added, removed or garbage
+        collected. Only weak references are held, so this does not extend the
+        lifetime of any callbacks.
+        """
+        plan = self._emit_plan
+        if plan is None:
+            plan = self._emit_plan = self._build_emit_plan()
+        return plan
     def add_method(self, m, **kwargs):
         """Add an instance method or function
 
@@ -56,10 +159,12 @@ class WeakMethodContainer(weakref.WeakValueDictionary):
         Args:
             obj: The instance object to remove
         """
-        to_remove = set()
-        for wrkey, _obj in self.iter_instances():
-            if obj is _obj:
-                to_remove.add(wrkey)
+        # Keys hold the object id, so only matching entries are dereferenced
+        obj_id = id(obj)
+        to_remove = [
+            wrkey for wrkey, wr in list(self.data.items())
+            if wrkey[1] == obj_id and wr() is obj
+        ]
         for wrkey in to_remove:
             del self[wrkey]
     def iter_instances(self):
@@ -69,8 +174,10 @@ class WeakMethodContainer(weakref.WeakValueDictionary):
             wrkey: The two-tuple key used to store the object
             obj: The instance or function object
         """
-        for wrkey in set(self.keys()):
-            obj = self.get(wrkey)
+        # Iterate over a copy since callbacks may be added or removed while
+        # this is being consumed
+        for wrkey, wr in list(self.data.items()):
+            obj = wr()
             if obj is None:
                 continue
             yield wrkey, obj
@@ -80,12 +187,13 @@ class WeakMethodContainer(weakref.WeakValueDictionary):
         Yields:
             Instance methods or function objects
         """
+        MethodType = types.MethodType
         for wrkey, obj in self.iter_instances():
             f, obj_id = wrkey
             if f == 'function':
-                yield self[wrkey]
+                yield obj
             else:
-                yield getattr(obj, f.__name__)
+                yield MethodType(f, obj)
 
 class InformativeDict(dict):
     def __delitem__(self, key):
@@ -111,11 +219,22 @@ class InformativeWVDict(weakref.WeakValueDictionary):
                 else:
                     # Atomic removal is necessary since this function
                     # can be called asynchronously by the GC
-                    _remove_dead_weakref(self.data, wr.key)
-                    self._data_del_callback(wr.key)
+                    if _remove_dead_key(self.data, wr.key):
+                        self._data_del_callback(wr.key)
         self._remove = remove
         self.data = InformativeDict()
         self.data.del_callback = self._data_del_callback
+    def _commit_removals(self):
+        # Removals deferred while iterating must notify as well
+        pop = self._pending_removals.pop
+        d = self.data
+        while True:
+            try:
+                key = pop()
+            except IndexError:
+                return
+            if _remove_dead_key(d, key):
+                self._data_del_callback(key)
     def _data_del_callback(self, key):
         self.del_callback(key)
 
@@ -137,41 +256,49 @@ class EmissionHoldLock:
             emission as a two-tuple. If no events were triggered while the lock
             was held, :obj:`None`.
         held (bool): The internal state of the lock
+        aio_locks (dict): Mapping of :class:`asyncio.Lock` instances used by
+            :keyword:`async with`, keyed by the :func:`id` of their event loop
     """
+    __slots__ = (
+        'event_instance', 'last_event', 'held', 'aio_locks', '_aio_lock_counts',
+        '_aio_loop_refs',
+    )
     def __init__(self, event_instance):
         self.event_instance = event_instance
         self.last_event = None
         self.held = False
-    @property
-    def aio_locks(self):
-        d = getattr(self, '_aio_locks', None)
-        if d is None:
-            d = self._aio_locks = {}
-        return d
+        self.aio_locks = {}
+        self._aio_lock_counts = {}
+        self._aio_loop_refs = {}
 
     def acquire(self):
         if self.held:
             return
         self.held = True
         self.last_event = None
+        # Mirrored on the event so its __call__ only needs a single lookup
+        self.event_instance._emission_held = True
     def release(self):
         if not self.held:
             return
-        if self.last_event is not None:
-            args, kwargs = self.last_event
+        self.held = False
+        self.event_instance._emission_held = False
+        last_event = self.last_event
+        if last_event is not None:
+            args, kwargs = last_event
             self.last_event = None
-            self.held = False
             self.event_instance(*args, **kwargs)
 
     async def acquire_async(self):
         self.acquire()
-        lock = await self._build_aio_lock()
-        if not lock.locked():
+        lock = self._build_aio_lock()
+        counts = self._aio_lock_counts
+        count = counts.get(lock, 0)
+        if not count:
             await lock.acquire()
+        counts[lock] = count + 1
     async def release_async(self):
-        lock = await self._build_aio_lock()
-        if lock.locked:
-            lock.release()
+        self._release_aio_lock()
         self.release()
 
     def __enter__(self):
@@ -184,13 +311,37 @@ class EmissionHoldLock:
         await self.acquire_async()
         return self
     async def __aexit__(self, *args):
-        await self.release_async()
+        # Nothing here needs to be awaited, so avoid the coroutine for
+        # release_async()
+        self._release_aio_lock()
+        self.release()
 
-    async def _build_aio_lock(self):
-        loop = asyncio.get_event_loop()
+    def _build_aio_lock(self):
+        loop = _get_running_loop()
         key = id(loop)
-        lock = self.aio_locks.get(key)
-        if lock is None:
-            lock = asyncio.Lock()
-            self.aio_locks[key] = lock
+        aio_locks = self.aio_locks
+        lock = aio_locks.get(key)
+        if lock is None or self._aio_loop_refs[key]() is not loop:
+            # Either no lock exists for the loop or it was created for a
+            # loop that has since been collected and its id reused
+            if lock is not None:
+                self._aio_lock_counts.pop(lock, None)
+            try:
+                loop_ref = ref(loop)
+            except TypeError:
+                # Loop implementations without weakref support are kept
+                # alive for as long as the lock is
+                loop_ref = lambda: loop
+            self._aio_loop_refs[key] = loop_ref
+            lock = aio_locks[key] = asyncio.Lock()
         return lock
+
+    def _release_aio_lock(self):
+        lock = self._build_aio_lock()
+        counts = self._aio_lock_counts
+        count = counts.get(lock, 0)
+        if count == 1:
+            del counts[lock]
+            lock.release()
+        elif count:
+            counts[lock] = count - 1
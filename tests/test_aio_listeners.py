@@ -431,3 +431,103 @@ async def test_changes_during_emit(sender_cls):
 
     e = sender.get_dispatcher_event('on_test')
     assert len(e.aio_listeners) == 1
+
+def test_stale_weakref_removal_keeps_replaced_key():
+    from pydispatch.aioutils import AioWeakMethodContainer
+
+    class Listener:
+        async def on_event(self, *args, **kwargs):
+            pass
+
+    loop = asyncio.new_event_loop()
+    try:
+        container = AioWeakMethodContainer()
+        a = Listener()
+        container.add_method(loop, a.on_event)
+        wrkey = next(iter(container.data))
+        old_wr = container.data[wrkey]
+
+        # Store a live object under the same key (as with a reused id) and
+        # deliver the removal callback for the old reference afterwards
+        b = Listener()
+        container[wrkey] = b
+        container._remove(old_wr)
+
+        assert container.data[wrkey]() is b
+        assert container.event_loop_map[wrkey] is loop
+    finally:
+        loop.close()
+
+@pytest.mark.parametrize('op', ['pop', 'popitem', 'clear'])
+def test_container_removal_ops(op):
+    from pydispatch.aioutils import AioWeakMethodContainer
+
+    class Listener:
+        async def on_event(self, *args, **kwargs):
+            pass
+
+    loop = asyncio.new_event_loop()
+    try:
+        container = AioWeakMethodContainer()
+        a = Listener()
+        container.add_method(loop, a.on_event)
+        wrkey = next(iter(container.data))
+        assert len(container._get_emit_plan()) == 1
+
+        if op == 'pop':
+            assert container.pop(wrkey) is a
+        elif op == 'popitem':
+            assert container.popitem() == (wrkey, a)
+        elif op == 'clear':
+            container.clear()
+
+        assert container._get_emit_plan() == ()
+        assert wrkey not in container.event_loop_map
+    finally:
+        loop.close()
+
+@pytest.mark.asyncio
+async def test_copy_on_change_after_aio_observers():
+    from pydispatch import Dispatcher, ListProperty
+    from pydispatch.properties import ObservableList
+
+    class A(Dispatcher):
+        test_list = ListProperty(copy_on_change=True)
+
+    class Listener:
+        async def on_prop(self, *args, **kwargs):
+            pass
+
+    copies = []
+    orig_deepcopy = ObservableList._deepcopy
+    def counting_deepcopy(self):
+        copies.append(True)
+        return orig_deepcopy(self)
+
+    loop = asyncio.get_event_loop()
+    a = A()
+    ObservableList._deepcopy = counting_deepcopy
+    try:
+        # A copy is made while a task awaits the event
+        task = asyncio.ensure_future(a.get_dispatcher_event('test_list'))
+        await asyncio.sleep(0)
+        a.test_list.append('a')
+        args, kwargs = await task
+        assert kwargs['old'] == []
+        assert len(copies) == 1
+
+        # ...but not once the waiter has been triggered
+        a.test_list.append('b')
+        assert len(copies) == 1
+
+        listener = Listener()
+        a.bind_async(loop, test_list=listener.on_prop)
+        a.test_list.append('c')
+        assert len(copies) == 2
+
+        a.unbind(listener)
+        a.test_list.append('d')
+        assert len(copies) == 2
+    finally:
+        ObservableList._deepcopy = orig_deepcopy
+    await asyncio.sleep(0)
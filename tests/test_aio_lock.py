@@ -52,6 +52,66 @@ async def test_aio_event_lock(listener, sender):
 
     assert rx_indecies == set(tx_indecies)
 
+@pytest.mark.asyncio
+async def test_aio_event_lock_nested(listener, sender):
+    loop = asyncio.get_event_loop()
+
+    sender.register_event('on_test')
+    sender.bind(on_test=listener.on_event)
+
+    async with sender.emission_lock('on_test') as elock:
+        async with sender.emission_lock('on_test'):
+            assert elock.aio_locks[id(loop)].locked()
+            sender.emit('on_test', 'a')
+        assert elock.aio_locks[id(loop)].locked()
+    assert not elock.aio_locks[id(loop)].locked()
+
+    assert len(listener.received_event_data) == 1
+    assert listener.received_event_data[0]['args'] == ('a', )
+
+@pytest.mark.asyncio
+async def test_aio_event_lock_reused_loop_id(listener, sender, monkeypatch):
+    import weakref
+    import pydispatch.utils
+
+    class NotALoop(object):
+        pass
+
+    loop = asyncio.get_event_loop()
+    key = id(loop)
+
+    sender.register_event('on_test')
+    elock = sender.emission_lock('on_test')
+
+    await elock.acquire_async()
+    old_lock = elock.aio_locks[key]
+    assert old_lock.locked()
+    assert elock._aio_lock_counts[old_lock] == 1
+
+    # Simulate a lock left over from a collected loop whose id was reused
+    other = NotALoop()
+    elock._aio_loop_refs[key] = weakref.ref(other)
+
+    lock = elock._build_aio_lock()
+    assert lock is not old_lock
+    assert not lock.locked()
+    assert elock.aio_locks[key] is lock
+    assert old_lock not in elock._aio_lock_counts
+    assert elock._aio_loop_refs[key]() is loop
+    assert elock._build_aio_lock() is lock
+    old_lock.release()
+    elock.release()
+
+    # Loops without weakref support are held by a plain callable
+    def no_weakref(obj):
+        raise TypeError(obj)
+    monkeypatch.setattr(pydispatch.utils, 'ref', no_weakref)
+    elock._aio_loop_refs[key] = weakref.ref(other)
+    lock2 = elock._build_aio_lock()
+    assert lock2 is not lock
+    assert elock._aio_loop_refs[key]() is loop
+    assert elock._build_aio_lock() is lock2
+
 @pytest.mark.asyncio
 async def test_aio_property_lock(listener):
     from pydispatch import Dispatcher, Property
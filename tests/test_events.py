@@ -181,6 +181,15 @@ def test_emission_lock(listener, sender):
     assert len(listener.received_event_data) == 1
     assert listener.received_event_data[0]['args'] == ('inner', )
 
+    listener.received_event_data = []
+
+    # Releasing without any captured emission must not keep the lock held
+    with sender.emission_lock('on_test'):
+        pass
+    sender.emit('on_test', 'unlocked')
+    assert len(listener.received_event_data) == 1
+    assert listener.received_event_data[0]['args'] == ('unlocked', )
+
 
 def test_bind_and_emit_unregistered():
     from pydispatch import Dispatcher, DoesNotExistError
@@ -229,3 +238,84 @@ def test_register_existing_property():
     with pytest.raises(PropertyExistsError) as excinfo:
         sender.register_event('foo')
     assert '"foo"' in str(excinfo.value)
+
+def test_lazy_event_creation(listener):
+    from pydispatch import Dispatcher, Property
+
+    class Sender(Dispatcher):
+        foo = Property()
+        _events_ = ['on_bar', 'on_baz']
+
+    sender = Sender()
+    events = sender._Dispatcher__events
+    assert set(events.keys()) == {'on_bar', 'on_baz'}
+    assert events['on_bar'] is None
+
+    # Emitting an unused event is a no-op and does not create it
+    sender.emit('on_bar', 1)
+    sender.foo = 1
+    assert events['on_bar'] is None
+    assert sender._Dispatcher__property_events['foo'] is None
+
+    sender.unbind(listener)
+
+    e = sender.get_dispatcher_event('on_bar')
+    assert events['on_bar'] is e
+    assert sender.get_dispatcher_event('on_bar') is e
+    assert events['on_baz'] is None
+
+    sender.bind(on_baz=listener.on_event)
+    sender.emit('on_baz', triggered_event='on_baz')
+    assert listener.received_events == ['on_baz']
+
+def test_builtin_mixin_subclass(listener):
+    from pydispatch import Dispatcher
+
+    class Sender(Dispatcher, Exception):
+        _events_ = ['on_test_a']
+
+    sender = Sender()
+    sender.arbitrary_attr = True
+    sender.bind(on_test_a=listener.on_event)
+    sender.emit('on_test_a', triggered_event='on_test_a')
+    assert listener.received_events == ['on_test_a']
+
+    d = Dispatcher()
+    d.arbitrary_attr = True
+
+@pytest.mark.parametrize('op', ['pop', 'popitem', 'setdefault', 'update', 'clear'])
+def test_emit_plan_invalidation(op):
+    from pydispatch.utils import WeakMethodContainer
+
+    class Listener(object):
+        def on_event(self, *args, **kwargs):
+            pass
+
+    container = WeakMethodContainer()
+    a, b = Listener(), Listener()
+    container.add_method(a.on_event)
+    key_a = next(iter(container.data))
+    key_b = (Listener.on_event, id(b))
+
+    def plan_keys():
+        return [wrkey for wrkey, wr, f in container._get_emit_plan()]
+
+    assert plan_keys() == [key_a]
+
+    if op == 'pop':
+        assert container.pop(key_a) is a
+        expected = []
+    elif op == 'popitem':
+        assert container.popitem() == (key_a, a)
+        expected = []
+    elif op == 'setdefault':
+        assert container.setdefault(key_b, b) is b
+        expected = [key_a, key_b]
+    elif op == 'update':
+        container.update({key_b:b})
+        expected = [key_a, key_b]
+    elif op == 'clear':
+        container.clear()
+        expected = []
+
+    assert plan_keys() == expected
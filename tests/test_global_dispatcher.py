@@ -9,6 +9,7 @@ import pytest
 def dispatcher_cleanup():
     yield
     pydispatch._GLOBAL_DISPATCHER._Dispatcher__events.clear()
+    pydispatch._GLOBAL_DISPATCHER._Dispatcher__all_events.clear()
     pydispatch.decorators._CACHED_CALLBACKS.cache.clear()
 
 def test_receiver_decorator(dispatcher_cleanup):
@@ -66,6 +67,23 @@ def test_receiver_decorator_unregistered_cache(dispatcher_cleanup):
     assert results == [((1,), {})]
 
 
+def test_receiver_decorator_unregistered_cache_multiple(dispatcher_cleanup):
+    results = []
+
+    @receiver('foo', cache=True)
+    def on_foo_a(*args, **kwargs):
+        results.append('a')
+
+    @receiver('foo', cache=True)
+    def on_foo_b(*args, **kwargs):
+        results.append('b')
+
+    pydispatch.register_event('foo')
+    pydispatch.emit('foo')
+
+    assert sorted(results) == ['a', 'b']
+
+
 def test_receiver_decorator_unregistered_auto_register(dispatcher_cleanup):
     results = []
 
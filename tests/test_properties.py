@@ -1,3 +1,4 @@
+import pytest
 
 def test_properties(listener):
     from pydispatch import Dispatcher, Property
@@ -129,9 +130,16 @@ def test_dict_property_ops(listener):
     a.bind(test_dict=listener.on_prop)
 
     v = a.test_dict.pop('a')
+    assert v == 1
     assert len(listener.property_events) == 1
     assert 'a' not in a.test_dict
 
+    # Popping a missing key does not change anything
+    assert a.test_dict.pop('a', None) is None
+    with pytest.raises(KeyError):
+        a.test_dict.pop('a')
+    assert len(listener.property_events) == 1
+
     listener.property_events = []
     del a.test_dict['b']
     assert len(listener.property_events) == 1
@@ -154,6 +162,44 @@ def test_dict_property_ops(listener):
     assert len(listener.property_events) == 1
     assert a.test_dict['foo'] == 'bar'
 
+    assert a.test_dict.setdefault('foo', 'baz') == 'bar'
+    assert len(listener.property_events) == 1
+
+def test_nested_container_copies(listener):
+    from pydispatch import Dispatcher, ListProperty, DictProperty
+
+    class A(Dispatcher):
+        test_list = ListProperty([[1]])
+        test_dict = DictProperty({'a':{'x':0}})
+
+    a = A()
+    a.bind(test_list=listener.on_prop, test_dict=listener.on_prop)
+
+    # Nested containers added to another slot are copied, not shared
+    a.test_list.append(a.test_list[0])
+    a.test_list[1].append(2)
+    assert a.test_list == [[1], [1, 2]]
+    assert a.test_list[0] is not a.test_list[1]
+
+    a.test_dict['b'] = a.test_dict['a']
+    a.test_dict['b']['x'] = 99
+    assert a.test_dict == {'a':{'x':0}, 'b':{'x':99}}
+    assert a.test_dict['a'] is not a.test_dict['b']
+
+    # Re-assigning to the same slot keeps the existing container
+    nested = a.test_list[0]
+    listener.property_events = []
+    a.test_list[0] = a.test_list[0]
+    assert a.test_list[0] is nested
+    assert len(listener.property_events) == 1
+    nested.append(3)
+    assert a.test_list == [[1, 3], [1, 2]]
+    assert len(listener.property_events) == 2
+
+    nested = a.test_dict['a']
+    a.test_dict['a'] = a.test_dict['a']
+    assert a.test_dict['a'] is nested
+
 def test_empty_defaults(listener):
     from pydispatch import Dispatcher, ListProperty, DictProperty
     from pydispatch.properties import ObservableList, ObservableDict
@@ -232,9 +278,76 @@ def test_removal():
 
     prop = A._PROPERTIES_['test_prop']
     del a
-    assert len(prop._Property__weakrefs) == 0
     assert len(prop._Property__storage) == 0
 
+def test_container_removal():
+    import gc
+    import weakref
+    from pydispatch import Dispatcher, ListProperty, DictProperty
+
+    class A(Dispatcher):
+        test_list = ListProperty()
+        test_dict = DictProperty()
+
+    def on_prop(*args, **kwargs):
+        pass
+
+    list_prop = A._PROPERTIES_['test_list']
+    dict_prop = A._PROPERTIES_['test_dict']
+
+    a = A()
+    a.bind(test_list=on_prop, test_dict=on_prop)
+    a.test_list.append({'a':[1]})
+    a.test_dict['b'] = [{'c':2}]
+    a.test_list = [[1, 2]]
+    a.test_dict = {'d':{}}
+    a_ref = weakref.ref(a)
+
+    del a
+    gc.collect()
+    assert a_ref() is None
+    assert len(list_prop._Property__storage) == 0
+    assert len(dict_prop._Property__storage) == 0
+
+def test_removal_untracked():
+    import gc
+    import weakref
+    from pydispatch import Dispatcher, Property, ListProperty
+
+    class Mixin(object):
+        mixin_prop = Property('mixin_default')
+        mixin_list = ListProperty()
+
+    class A(Mixin, Dispatcher):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.register_event('mixin_prop', 'mixin_list', 'extra_prop')
+
+    # Attached after class creation (not in _PROPERTIES_)
+    A.extra_prop = Property('extra_default')
+    A.extra_prop.__set_name__(A, 'extra_prop')
+
+    mixin_prop = Mixin.mixin_prop
+    mixin_list = Mixin.mixin_list
+    extra_prop = A.extra_prop
+
+    for i in range(200):
+        a = A()
+        assert a.mixin_prop == 'mixin_default'
+        assert a.extra_prop == 'extra_default'
+        a.mixin_prop = i
+        a.extra_prop = i
+        assert a.mixin_list == []
+        a.mixin_list.append(i)
+        a_ref = weakref.ref(a)
+        del a
+
+    gc.collect()
+    assert a_ref() is None
+    assert len(mixin_prop._Property__storage) == 0
+    assert len(mixin_list._Property__storage) == 0
+    assert len(extra_prop._Property__storage) == 0
+
 def test_self_binding():
     from pydispatch import Dispatcher, Property, ListProperty, DictProperty
 
@@ -378,6 +491,13 @@ def test_copy_on_change(listener):
         'foo':None, 'nested_dict':{'a':1, 'b':2}, 'nested_list':['a', 'b']
     }
 
+    a.test_dict.update({'foo':1, 'bar':2})
+    assert len(listener.property_event_kwargs) == 7
+    assert listener.property_event_kwargs[6]['old'] == {
+        'foo':None, 'nested_dict':{'a':1, 'b':2}, 'nested_list':['a', 'b', 'c']
+    }
+    assert set(listener.property_event_kwargs[6]['keys']) == {'foo', 'bar'}
+
     listener.property_event_kwargs = []
 
     a.test_list.append('a')
@@ -434,3 +554,29 @@ def test_copy_on_change(listener):
 
     a.no_cp_list[1].append(1)
     assert listener.property_event_kwargs[5]['old'] == None
+
+def test_copy_on_change_unobserved(listener, monkeypatch):
+    from pydispatch import Dispatcher, ListProperty
+    from pydispatch.properties import ObservableList
+
+    class A(Dispatcher):
+        test_list = ListProperty(copy_on_change=True)
+
+    copies = []
+    orig_deepcopy = ObservableList._deepcopy
+    def counting_deepcopy(self):
+        copies.append(True)
+        return orig_deepcopy(self)
+    monkeypatch.setattr(ObservableList, '_deepcopy', counting_deepcopy)
+
+    a = A()
+
+    # No copies are needed while nothing observes the property
+    a.test_list.append('a')
+    a.test_list.extend(['b', 'c'])
+    assert len(copies) == 0
+
+    a.bind(test_list=listener.on_prop)
+    a.test_list.append('d')
+    assert len(copies) == 1
+    assert listener.property_event_kwargs[0]['old'] == ['a', 'b', 'c']
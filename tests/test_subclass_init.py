@@ -96,3 +96,15 @@ def test_new_class_creation():
     c.prop_c = 'cc'
     assert a.prop_a != b.prop_a != c.prop_a
     assert b.prop_b != c.prop_b
+
+
+def test_base_dispatcher_construction():
+    from pydispatch import Dispatcher
+
+    assert Dispatcher._PROPERTIES_ == {}
+    assert Dispatcher._EVENTS_ == set()
+
+    d = Dispatcher()
+    d.register_event('on_foo')
+    assert set(d._Dispatcher__events.keys()) == {'on_foo'}
+    assert Dispatcher._EVENTS_ == set()